@@ -1,10 +1,9 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from sklearn.ensemble import RandomForestClassifier
 import streamlit.components.v1 as components
 import os
 
+from model import load_and_train_model, score_inputs, usage_sensitivity
+
 # --- 1. PAGE CONFIGURATION ---
 st.set_page_config(
     page_title="Teen Risk Predictor",
@@ -19,55 +18,35 @@ st.markdown("""
 **Client:** Health Insurer | **Goal:** Prevent Crisis Episodes ($2,673/event)
 """)
 
-# --- 3. MODEL LOADING (Cached) ---
-@st.cache_data
-def load_and_train_model():
-    """
-    Loads data, trains the Random Forest model on the fly, and returns it.
-    This function is cached so it only runs once per session.
-    """
-    file_path = 'data/teen_phone_addiction_dataset.csv'
-    
-    if not os.path.exists(file_path):
-        return None, None
-
-    df = pd.read_csv(file_path)
-
-    # Target Definition (Crisis = Addiction Score > 9.5)
-    df['High_Risk'] = np.where(df['Addiction_Level'] > 9.5, 1, 0)
-    
-    # Feature Engineering (Replicating the Pipeline)
-    df['Usage_to_Sleep_Ratio'] = df['Daily_Usage_Hours'] / df['Sleep_Hours']
-    df['Checks_per_App'] = df['Phone_Checks_Per_Day'] / df['Apps_Used_Daily']
-    
-    # Select Features
-    feature_cols = ['Daily_Usage_Hours', 'Sleep_Hours', 'Phone_Checks_Per_Day', 
-                    'Apps_Used_Daily', 'Time_on_Social_Media', 
-                    'Usage_to_Sleep_Ratio', 'Checks_per_App']
-    
-    X = df[feature_cols]
-    y = df['High_Risk']
-    
-    # Train Model (Balanced Class Weight is Critical)
-    rf = RandomForestClassifier(n_estimators=100, random_state=42, class_weight='balanced')
-    rf.fit(X, y)
-    
-    return rf, feature_cols
-
-# Initialize Model
-model, feature_cols = load_and_train_model()
+# --- 3. MODEL LOADING (Cached in model.py) ---
+model, predict_risk, _ = load_and_train_model()
 
 if model is None:
     st.error("🚨 Error: Dataset not found. Please ensure 'data/teen_phone_addiction_dataset.csv' exists.")
     st.stop()
 
-# --- 4. LAYOUT: TABS ---
+# --- 4. REPORT LOADING (Cached) ---
+@st.cache_data(show_spinner=False)
+def load_report(path, mtime):
+    """
+    Reads the HTML quality report once instead of on every rerun.
+    The file's mtime is part of the cache key so a regenerated report is picked up.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+# --- 5. LAYOUT: TABS ---
 tab1, tab2 = st.tabs(["🚀 Risk Predictor (MVP)", "📊 Data Quality Report"])
 
 # ==========================================
 # TAB 1: THE PREDICTION TOOL
 # ==========================================
-with tab1:
+@st.fragment
+def render_predictor():
+    """
+    Sidebar inputs, prediction and dashboard. Runs as a fragment so slider
+    changes rerun only this block, not the page chrome or the report tab.
+    """
     # Sidebar Inputs
     st.sidebar.header("User Behavior Inputs")
     daily_usage = st.sidebar.slider("Daily Usage (Hours)", 0.0, 12.0, 5.0)
@@ -76,16 +55,11 @@ with tab1:
     apps_used = st.sidebar.slider("Apps Used Daily", 1, 20, 5)
     social_time = st.sidebar.slider("Time on Social Media (Hours)", 0.0, 10.0, 2.0)
 
-    # Real-time Feature Calculation
+    # Real-time Feature Calculation (shown in the explanation below)
     usage_sleep_ratio = daily_usage / sleep_hours
-    checks_app_ratio = phone_checks / apps_used
-
-    # Create Input Data
-    input_data = pd.DataFrame([[daily_usage, sleep_hours, phone_checks, apps_used, social_time, usage_sleep_ratio, checks_app_ratio]],
-                              columns=feature_cols)
 
-    # Get Prediction
-    prob = model.predict_proba(input_data)[0][1]
+    # Get Prediction (memoized on the raw slider values)
+    prob = score_inputs(predict_risk, daily_usage, sleep_hours, phone_checks, apps_used, social_time)
     
     # STRATEGY: Threshold Tuning (0.40)
     threshold = 0.40
@@ -128,6 +102,15 @@ with tab1:
     - **Compulsion:** Checking {phone_checks} times across {apps_used} apps.
     """)
 
+    # What-if: risk across daily usage with the other inputs held fixed
+    usage_grid, usage_probs = usage_sensitivity(predict_risk, sleep_hours, phone_checks, apps_used, social_time)
+    st.caption("Risk probability vs. daily usage (other inputs unchanged)")
+    st.line_chart({"Daily Usage (Hours)": usage_grid, "Risk Probability": usage_probs},
+                  x="Daily Usage (Hours)", y="Risk Probability")
+
+with tab1:
+    render_predictor()
+
 # ==========================================
 # TAB 2: DATA QUALITY REPORT
 # ==========================================
@@ -141,8 +124,7 @@ with tab2:
         report_path = "reports/teen_phone_addiction_dataset_quality_report.html"
 
     try:
-        with open(report_path, 'r', encoding='utf-8') as f:
-            report_html = f.read()
+        report_html = load_report(report_path, os.path.getmtime(report_path))
         
         # Display HTML
         components.html(report_html, height=800, scrolling=True)
@@ -0,0 +1,221 @@
+"""
+Risk Model
+==========
+Training, disk caching and fast prediction for the Random Forest used by
+the Streamlit app. Kept in one module so every page shares a single
+cached model instead of each training its own.
+
+Prediction runs through ONNX Runtime when it is installed, otherwise
+through a NumPy walk over the forest's node arrays (see pack_forest).
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import sklearn
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import roc_auc_score
+import joblib
+import functools
+import hashlib
+import os
+import warnings
+
+# ONNX Runtime is an optional fast path for single-row prediction
+try:
+    import onnxruntime as ort
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+except ImportError:
+    ort = None
+
+
+MODEL_CACHE_PATH = 'model_cache.joblib'
+MODEL_CACHE_VERSION = 2  # Bump when the training code changes
+
+
+def build_onnx_session(onnx_bytes):
+    """Creates a single-threaded ONNX Runtime session (inputs are one row)."""
+    sess_options = ort.SessionOptions()
+    sess_options.intra_op_num_threads = 1
+    return ort.InferenceSession(onnx_bytes, sess_options=sess_options,
+                                providers=['CPUExecutionProvider'])
+
+
+def pack_forest(rf):
+    """
+    Freezes a fitted forest into padded (n_trees, max_nodes) node arrays
+    plus each node's P(High Risk), so prediction is a handful of NumPy
+    gathers instead of one sklearn/joblib call per tree.
+    """
+    trees = [est.tree_ for est in rf.estimators_]
+    n_trees = len(trees)
+    max_nodes = max(t.node_count for t in trees)
+
+    # Padding nodes are leaves (-1 children) that are never reached
+    feature = np.zeros((n_trees, max_nodes), dtype=np.intp)
+    threshold = np.zeros((n_trees, max_nodes), dtype=np.float64)
+    left = np.full((n_trees, max_nodes), -1, dtype=np.intp)
+    right = np.full((n_trees, max_nodes), -1, dtype=np.intp)
+    leaf_p = np.zeros((n_trees, max_nodes), dtype=np.float64)
+
+    for i, t in enumerate(trees):
+        n = t.node_count
+        feature[i, :n] = np.maximum(t.feature, 0)  # Leaves store -2; any valid index works
+        threshold[i, :n] = t.threshold
+        left[i, :n] = t.children_left
+        right[i, :n] = t.children_right
+        leaf_p[i, :n] = t.value[:, 0, 1] / t.value[:, 0, :].sum(axis=1)
+
+    depth = max(t.max_depth for t in trees)
+    return feature, threshold, left, right, leaf_p, depth
+
+
+def predict_packed(packed, X):
+    """Returns P(High Risk) for each row of X by walking all trees at once."""
+    feature, threshold, left, right, leaf_p, depth = packed
+    tree_idx = np.arange(feature.shape[0])
+    rows = np.arange(X.shape[0])[:, None]
+    node = np.zeros((X.shape[0], feature.shape[0]), dtype=np.intp)
+
+    for _ in range(depth):
+        f = feature[tree_idx, node]
+        go_left = X[rows, f] <= threshold[tree_idx, node]
+        child = np.where(go_left, left[tree_idx, node], right[tree_idx, node])
+        node = np.where(child == -1, node, child)  # Rows that reached a leaf stay there
+
+    return leaf_p[tree_idx, node].mean(axis=1)
+
+
+def make_predictor(rf, onnx_bytes):
+    """Returns a function mapping a float32 (n, 7) array to P(High Risk) per row."""
+    if ort is not None and onnx_bytes is not None:
+        ort_sess = build_onnx_session(onnx_bytes)
+        return lambda X: ort_sess.run(None, {'input': X})[1][:, 1]
+
+    packed = pack_forest(rf)
+    return lambda X: predict_packed(packed, X)
+
+
+@functools.lru_cache(maxsize=512)
+def score_inputs(predict_risk, daily_usage, sleep_hours, phone_checks, apps_used, social_time):
+    """
+    Returns P(High Risk) for one set of slider values, engineering the two
+    ratio features the same way training does. Memoized on the raw values:
+    sliders move in discrete steps, so users keep revisiting the same inputs.
+    """
+    x = np.array([[daily_usage, sleep_hours, phone_checks, apps_used, social_time,
+                   daily_usage / sleep_hours, phone_checks / apps_used]], dtype=np.float32)
+    return float(predict_risk(x)[0])
+
+
+@functools.lru_cache(maxsize=128)
+def usage_sensitivity(predict_risk, sleep_hours, phone_checks, apps_used, social_time, n_points=50):
+    """
+    Returns (daily_usage_grid, probabilities) for a what-if sweep of Daily
+    Usage from 0 to 12 hours with the other inputs held fixed. All rows go
+    through the model in one batch, which costs about the same as one row.
+    """
+    usage = np.linspace(0.0, 12.0, n_points)
+    grid = np.empty((n_points, 7), dtype=np.float32)
+    grid[:] = [0.0, sleep_hours, phone_checks, apps_used, social_time, 0.0, phone_checks / apps_used]
+    grid[:, 0] = usage
+    grid[:, 5] = usage / sleep_hours
+    return usage, predict_risk(grid)
+
+
+@st.cache_resource
+def load_and_train_model():
+    """
+    Loads data, trains the Random Forest model, and returns it together with
+    a fast predict function (see make_predictor).
+    The fitted model is persisted to disk so fresh processes can reload it
+    instead of retraining, and is cached as a shared resource so it is
+    reused by reference instead of being pickled on every rerun.
+    """
+    file_path = 'data/teen_phone_addiction_dataset.csv'
+    
+    if not os.path.exists(file_path):
+        return None, None, None
+
+    # Select Features
+    feature_cols = ['Daily_Usage_Hours', 'Sleep_Hours', 'Phone_Checks_Per_Day', 
+                    'Apps_Used_Daily', 'Time_on_Social_Media', 
+                    'Usage_to_Sleep_Ratio', 'Checks_per_App']
+
+    # Model Definition (Balanced Class Weight is Critical; trees are built in parallel)
+    # warm_start + oob_score let the forest grow 10 trees at a time (see training below)
+    rf = RandomForestClassifier(n_estimators=10, max_depth=10, min_samples_leaf=5,
+                                warm_start=True, oob_score=True,
+                                random_state=42, class_weight='balanced', n_jobs=-1)
+
+    # Disk Cache: reuse the saved model if data, features and params are unchanged
+    cache_key = hashlib.sha256(repr((
+        MODEL_CACHE_VERSION, os.path.getmtime(file_path), feature_cols,
+        sorted(rf.get_params().items()), sklearn.__version__
+    )).encode()).hexdigest()
+
+    if os.path.exists(MODEL_CACHE_PATH):
+        try:
+            cached = joblib.load(MODEL_CACHE_PATH, mmap_mode='r')
+        except Exception:
+            cached = None
+        if cached is not None and cached.get('key') == cache_key:
+            # A cache written without ONNX is only reusable if ONNX is still missing
+            onnx_bytes = cached.get('onnx')
+            if ort is None or onnx_bytes is not None:
+                return cached['model'], make_predictor(cached['model'], onnx_bytes), feature_cols
+
+    # Only parse the raw columns the pipeline uses, with fixed dtypes
+    # (float64 so the ratios match the ones computed from slider values)
+    raw_cols = ['Daily_Usage_Hours', 'Sleep_Hours', 'Phone_Checks_Per_Day',
+                'Apps_Used_Daily', 'Time_on_Social_Media', 'Addiction_Level']
+    df = pd.read_csv(file_path, usecols=raw_cols, dtype={c: np.float64 for c in raw_cols})
+
+    # Target Definition (Crisis = Addiction Score > 9.5)
+    y = (df['Addiction_Level'].to_numpy() > 9.5).astype(np.int8)
+    
+    # Feature Matrix: plain float32 (the tree dtype, and what inputs are predicted on)
+    X = np.empty((len(df), len(feature_cols)), dtype=np.float32)
+    X[:, :5] = df[feature_cols[:5]].to_numpy()  # The five raw slider inputs
+    
+    # Feature Engineering (Replicating the Pipeline), divided straight into X
+    np.divide(df['Daily_Usage_Hours'].to_numpy(), df['Sleep_Hours'].to_numpy(),
+              out=X[:, feature_cols.index('Usage_to_Sleep_Ratio')])
+    np.divide(df['Phone_Checks_Per_Day'].to_numpy(), df['Apps_Used_Daily'].to_numpy(),
+              out=X[:, feature_cols.index('Checks_per_App')])
+    
+    # Train Model: add trees until out-of-bag ROC AUC gains < 0.001 (capped at 100 trees)
+    # Every fit sees the full dataset, so the 'balanced' weights stay exact under warm_start
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='class_weight presets')
+        warnings.filterwarnings('ignore', message='Some inputs do not have OOB scores')
+        rf.fit(X, y)
+        best_auc = roc_auc_score(y, rf.oob_decision_function_[:, 1])
+        while rf.n_estimators < 100:
+            rf.n_estimators += 10
+            rf.fit(X, y)
+            oob_auc = roc_auc_score(y, rf.oob_decision_function_[:, 1])
+            if oob_auc - best_auc < 1e-3:
+                break
+            best_auc = oob_auc
+
+    # Predict sequentially: for a single row the joblib pool costs more than the trees
+    rf.n_jobs = 1
+
+    # Compile the forest to ONNX (probabilities as a plain tensor, no ZipMap)
+    onnx_bytes = None
+    if ort is not None:
+        onnx_model = convert_sklearn(
+            rf, initial_types=[('input', FloatTensorType([None, len(feature_cols)]))],
+            options={id(rf): {'zipmap': False}}
+        )
+        onnx_bytes = onnx_model.SerializeToString()
+
+    # Uncompressed so the tree arrays can be memory-mapped on reload
+    try:
+        joblib.dump({'key': cache_key, 'model': rf, 'onnx': onnx_bytes}, MODEL_CACHE_PATH)
+    except OSError:
+        pass
+    
+    return rf, make_predictor(rf, onnx_bytes), feature_cols
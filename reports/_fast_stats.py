@@ -0,0 +1,179 @@
+"""
+Fast IQR Statistics
+===================
+Per-column quartiles, IQR-fence outlier counts and whisker ends for
+data_quality_report.py, computed in one call over a float64 matrix.
+
+Uses a numba kernel parallelized across columns when numba is installed,
+otherwise the equivalent NumPy reductions. Both paths use NumPy's
+'linear' percentile rule, so results are identical.
+"""
+
+import warnings
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _iqr_stats_numpy(arr: np.ndarray) -> tuple:
+    """NaN-aware reductions over all columns of arr at once."""
+    q1, med, q3 = np.nanpercentile(arr, [25, 50, 75], axis=0)
+    iqr = q3 - q1
+    low = arr < q1 - 1.5 * iqr
+    high = arr > q3 + 1.5 * iqr
+
+    # NaN compares False on both sides, so missing cells are never outliers
+    inside = np.where(low | high, np.nan, arr)
+    with np.errstate(invalid='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+        whislo = np.nanmin(inside, axis=0)
+        whishi = np.nanmax(inside, axis=0)
+
+    # Like matplotlib's boxplot_stats, whiskers never end inside the box
+    # (fmin/fmax also give q1/q3 when no value lies within the fences)
+    whislo = np.fmin(whislo, q1)
+    whishi = np.fmax(whishi, q3)
+
+    return q1, med, q3, low.sum(axis=0), high.sum(axis=0), whislo, whishi
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _select(vals, k, left, right):
+        # In-place quickselect on vals[left:right + 1]: afterwards vals[k] is
+        # the k-th smallest value, smaller ones before it, larger ones after
+        while right > left:
+            mid = (left + right) // 2
+            # Median-of-three pivot
+            if vals[mid] < vals[left]:
+                vals[mid], vals[left] = vals[left], vals[mid]
+            if vals[right] < vals[left]:
+                vals[right], vals[left] = vals[left], vals[right]
+            if vals[right] < vals[mid]:
+                vals[right], vals[mid] = vals[mid], vals[right]
+            pivot = vals[mid]
+            i = left
+            j = right
+            while i <= j:
+                while vals[i] < pivot:
+                    i += 1
+                while vals[j] > pivot:
+                    j -= 1
+                if i <= j:
+                    vals[i], vals[j] = vals[j], vals[i]
+                    i += 1
+                    j -= 1
+            if k <= j:
+                right = j
+            elif k >= i:
+                left = i
+            else:
+                break
+        return vals[k]
+
+    @njit(cache=True)
+    def _quantile(vals, p, start):
+        # Same arithmetic as NumPy's 'linear' method (see numpy _lerp).
+        # vals[:start] must already hold values <= every quantile asked for.
+        n = vals.shape[0]
+        idx = (n - 1) * p
+        lo = int(np.floor(idx))
+        hi = min(lo + 1, n - 1)
+        t = idx - lo
+        a = _select(vals, lo, start, n - 1)
+        b = a if hi == lo else vals[hi:].min()
+        diff = b - a
+        if t >= 0.5:
+            return b - diff * (1 - t), lo
+        return a + diff * t, lo
+
+    @njit(parallel=True, cache=True)
+    def _iqr_stats_numba(arr):
+        n_cols = arr.shape[1]
+        q1 = np.full(n_cols, np.nan)
+        med = np.full(n_cols, np.nan)
+        q3 = np.full(n_cols, np.nan)
+        low_counts = np.zeros(n_cols, dtype=np.int64)
+        high_counts = np.zeros(n_cols, dtype=np.int64)
+        whislo = np.full(n_cols, np.nan)
+        whishi = np.full(n_cols, np.nan)
+
+        for j in prange(n_cols):
+            col = arr[:, j]
+            vals = col[~np.isnan(col)]
+            if vals.shape[0] == 0:
+                continue
+
+            # Each selection only searches the part right of the previous one
+            q1[j], k = _quantile(vals, 0.25, 0)
+            med[j], k = _quantile(vals, 0.5, k)
+            q3[j], k = _quantile(vals, 0.75, k)
+            iqr = q3[j] - q1[j]
+            lower = q1[j] - 1.5 * iqr
+            upper = q3[j] + 1.5 * iqr
+
+            # One scan for the fence counts and the whisker ends
+            n_low = 0
+            n_high = 0
+            lo = np.inf
+            hi = -np.inf
+            for v in vals:
+                if v < lower:
+                    n_low += 1
+                elif v > upper:
+                    n_high += 1
+                else:
+                    lo = min(lo, v)
+                    hi = max(hi, v)
+            low_counts[j] = n_low
+            high_counts[j] = n_high
+            # Whiskers never end inside the box (q1/q3 if nothing is in the fences)
+            whislo[j] = min(lo, q1[j])
+            whishi[j] = max(hi, q3[j])
+
+        return q1, med, q3, low_counts, high_counts, whislo, whishi
+
+
+def iqr_stats(arr: np.ndarray) -> tuple:
+    """
+    Return (Q1, median, Q3, low outlier counts, high outlier counts,
+    whisker low, whisker high) per column of a 2-D float64 array.
+    """
+    if njit is not None:
+        return _iqr_stats_numba(arr)
+    return _iqr_stats_numpy(arr)
+
+
+if __name__ == "__main__":
+    # Self-check: compare against matplotlib on small and heavy-tailed samples
+    from matplotlib import cbook
+
+    rng = np.random.default_rng(0)
+    columns = [rng.normal(size=rng.integers(1, 8)) * 30 for _ in range(2000)]
+    columns += [rng.standard_cauchy(size=rng.integers(5, 200)) for _ in range(1000)]
+    columns.append(np.array([-49.9, -6.9, 9.3, -0.9]))
+
+    width = max(len(c) for c in columns)
+    arr = np.full((width, len(columns)), np.nan)
+    for j, c in enumerate(columns):
+        arr[:len(c), j] = c
+
+    keys = ('q1', 'med', 'q3', 'whislo', 'whishi')
+    expected = np.array([[cbook.boxplot_stats(c)[0][k] for k in keys] for c in columns]).T
+    paths = {'numpy': _iqr_stats_numpy}
+    if njit is not None:
+        paths['numba'] = _iqr_stats_numba
+
+    failed = False
+    for name, fn in paths.items():
+        got = fn(np.asfortranarray(arr))
+        got = np.array([got[0], got[1], got[2], got[5], got[6]])
+        bad = int((~np.isclose(got, expected, rtol=0, atol=1e-12)).any(axis=0).sum())
+        print(f"{name}: {bad} of {len(columns)} columns differ from matplotlib")
+        failed |= bad > 0
+    raise SystemExit(1 if failed else 0)
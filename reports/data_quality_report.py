@@ -7,7 +7,7 @@ A comprehensive tool for analyzing CSV datasets and identifying:
 - Duplicate rows
 
 Usage:
-    python data_quality_report.py <path_to_csv>
+    python data_quality_report.py <path_to_csv> [output.html] [--no-cache]
     
 Output:
     - Console summary report
@@ -16,14 +16,25 @@ Output:
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless: figures are only rendered into the HTML report
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
+import contextlib
+import hashlib
+import pickle
+import re
 import sys
 import warnings
 from datetime import datetime
 import base64
-from io import BytesIO
+from io import BytesIO, StringIO
+
+try:
+    from ._fast_stats import iqr_stats
+except ImportError:  # run as a script from reports/
+    from _fast_stats import iqr_stats
 
 warnings.filterwarnings('ignore')
 
@@ -31,54 +42,304 @@ warnings.filterwarnings('ignore')
 plt.style.use('seaborn-v0_8-whitegrid')
 sns.set_palette("husl")
 
+# Columns where a negative value is impossible (matched on lower-cased name)
+_NONNEG_COLS = {'age', 'price', 'quantity', 'count', 'amount'}
+
+# Console progress bars, indexed by filled blocks (one block per 5%)
+_BARS = tuple("█" * k + "░" * (20 - k) for k in range(21))
+
+# Identifier columns: "id"/"name" on their own or as a "_id"/"_name" suffix
+_IDENT_RE = re.compile(r'(?:^|_)(?:id|name)\Z', re.IGNORECASE)
+
+# Cached analyses (report data + rendered figures), keyed on the input file
+REPORT_CACHE_DIR = Path('~/.cache/dqr').expanduser()
+REPORT_CACHE_VERSION = 3  # Bump when the analysis or figure code changes
+
+# Duplicates card verdict when no exact duplicate rows exist
+_NO_DUPLICATES_HTML = """
+            <div class="summary-section" style="background: #e8f5e9;">
+                <h4>✅ No Exact Duplicates</h4>
+                <p>Great! No exact duplicate rows were found in the dataset.</p>
+            </div>
+            """
+
+# Categorical card body when the dataset has no categorical columns
+_NO_CATEGORICAL_HTML = "<p>No categorical columns found in the dataset.</p>"
+
+# Quality score bands: (minimum score, color, verdict), best first
+_SCORE_BANDS = (
+    (80, '#27ae60', 'Excellent data quality!'),
+    (60, '#f39c12', 'Good quality with some issues to address'),
+    (0, '#e74c3c', 'Significant data quality issues detected'),
+)
+
+# Figures are inlined as SVG up to this size, larger ones fall back to PNG
+_SVG_MAX_BYTES = 256 * 1024
+
+# Embedded PNGs: screen resolution, fast zlib level (single render pass)
+_PNG_DPI = 96
+_PNG_KWARGS = {'optimize': False, 'compress_level': 1}
+
+# Maximum flier points drawn per side of each boxplot
+_MAX_FLIERS = 200
+
+# Shape checks for text columns that may really be numbers or dates
+_NUM_RE = re.compile(r'^\s*[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?\s*$')
+_DATE_RE = re.compile(r'^\s*(\d{4}[-/.]\d{1,2}[-/.]\d{1,2}|\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4})')
+
+
+# Stylesheet embedded in the HTML report
+_REPORT_CSS = """\
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body { 
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
+            line-height: 1.6; 
+            color: #333;
+            background: #f5f7fa;
+            padding: 20px;
+        }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 20px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .header h1 { font-size: 2em; margin-bottom: 10px; }
+        .header .meta { opacity: 0.9; font-size: 0.95em; }
+        .card {
+            background: white;
+            border-radius: 10px;
+            padding: 25px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.08);
+        }
+        .card h2 {
+            color: #667eea;
+            border-bottom: 2px solid #667eea;
+            padding-bottom: 10px;
+            margin-bottom: 20px;
+        }
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin-bottom: 20px;
+        }
+        .stat-box {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            border-left: 4px solid #667eea;
+        }
+        .stat-box .number { font-size: 2em; font-weight: bold; color: #667eea; }
+        .stat-box .label { color: #666; font-size: 0.9em; }
+        .warning { color: #e74c3c; }
+        .success { color: #27ae60; }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 15px 0;
+            font-size: 0.9em;
+        }
+        th, td {
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid #ddd;
+        }
+        th { background: #f8f9fa; font-weight: 600; }
+        tr:hover { background: #f8f9fa; }
+        .visualization { text-align: center; margin: 20px 0; }
+        .visualization img { max-width: 100%; border-radius: 8px; }
+        .visualization svg { max-width: 100%; height: auto; }
+        .progress-bar {
+            background: #e9ecef;
+            border-radius: 10px;
+            height: 20px;
+            overflow: hidden;
+        }
+        .progress-fill {
+            height: 100%;
+            background: linear-gradient(90deg, #667eea, #764ba2);
+            transition: width 0.3s;
+        }
+        .badge {
+            display: inline-block;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 0.8em;
+            font-weight: 600;
+        }
+        .badge-danger { background: #ffebee; color: #c62828; }
+        .badge-warning { background: #fff3e0; color: #ef6c00; }
+        .badge-success { background: #e8f5e9; color: #2e7d32; }
+        .summary-section {
+            background: linear-gradient(135deg, #f5f7fa 0%, #e4e8ec 100%);
+            padding: 20px;
+            border-radius: 8px;
+            margin-top: 20px;
+        }
+        .footer {
+            text-align: center;
+            padding: 20px;
+            color: #666;
+            font-size: 0.9em;
+        }
+"""
+
+# Static rest of <head> and the page wrapper, written verbatim
+_REPORT_HEAD = f"""\
+    <style>
+{_REPORT_CSS}    </style>
+</head>
+<body>
+    <div class="container">
+"""
+_REPORT_END = """\
+    </div>
+</body>
+</html>
+"""
+
+
+def _quality_score(missing_pct: float, dup_pct: float, high_outlier_cols: int) -> int:
+    """
+    Data quality score (0-100): capped deductions for missing values,
+    duplicate rows and columns with more than 10% outliers.
+    """
+    return max(0, round(100
+                        - min(30, missing_pct * 0.5)
+                        - min(20, dup_pct * 2)
+                        - min(20, high_outlier_cols * 5)))
+
+
+class _Tee(StringIO):
+    """Text buffer that also forwards everything written to another stream."""
+
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+
+    def write(self, s):
+        self._stream.write(s)
+        return super().write(s)
+
+    def flush(self):
+        self._stream.flush()
+
 
 class DataQualityReport:
     """Generate comprehensive data quality reports for CSV datasets."""
     
-    def __init__(self, filepath: str):
-        """Initialize with path to CSV file."""
+    def __init__(self, filepath: str, engine: str = "c", use_cache: bool = False):
+        """
+        Initialize with path to CSV file.
+
+        engine: CSV parser, "c" (pandas default) or "pyarrow" (multithreaded
+        Arrow reader, falls back to "c" if pyarrow is missing or fails).
+        use_cache: reuse the analysis of an unchanged file from
+        REPORT_CACHE_DIR instead of recomputing it. Off by default because
+        entries are unpickled; the command line turns it on.
+        """
         self.filepath = Path(filepath)
+        self.engine = engine
+        self.use_cache = use_cache
+        self._figures = None
         self.df = None
+        self._row_hash = None
+        self._null_mask = None
+        self._boxplot_stats = {}
         self.report_data = {}
         
+    def _read_csv(self) -> pd.DataFrame:
+        """Read the CSV with the configured engine."""
+        if self.engine == "pyarrow":
+            try:
+                return pd.read_csv(self.filepath, engine="pyarrow")
+            except (ImportError, ValueError) as e:
+                print(f"  pyarrow engine unavailable ({e}), using the C parser")
+        return pd.read_csv(self.filepath, engine="c", low_memory=False)
+    
     def load_data(self) -> bool:
         """Load the CSV file into a DataFrame."""
         try:
-            self.df = pd.read_csv(self.filepath)
+            self.df = self._read_csv()
+            
+            # Cache frame metadata used by every analysis step
+            self._n_rows = len(self.df)
+            self._columns = self.df.columns
+            self._dtypes = self.df.dtypes
+            self._optimize_dtypes()
+            self._numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+            self._categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns.tolist()
+            self._row_hash = None
+            self._null_mask = None
+            
             self.report_data['filename'] = self.filepath.name
-            self.report_data['rows'] = len(self.df)
-            self.report_data['columns'] = len(self.df.columns)
-            self.report_data['column_names'] = list(self.df.columns)
+            self.report_data['rows'] = self._n_rows
+            self.report_data['columns'] = len(self._columns)
+            self.report_data['column_names'] = list(self._columns)
             print(f"✓ Loaded '{self.filepath.name}' successfully")
-            print(f"  Shape: {self.df.shape[0]:,} rows × {self.df.shape[1]} columns\n")
+            print(f"  Shape: {self._n_rows:,} rows × {len(self._columns)} columns\n")
             return True
         except Exception as e:
             print(f"✗ Error loading file: {e}")
             return False
     
+    def _optimize_dtypes(self):
+        """
+        Shrink column storage after load without changing any value.
+
+        Integers are downcast to the smallest type that holds them, floats
+        go to float32 only when every value survives the round trip, and
+        repetitive text columns become category. Reported dtypes still come
+        from self._dtypes, captured before this runs.
+        """
+        for col in self._columns:
+            s = self.df[col]
+            if pd.api.types.is_integer_dtype(s.dtype):
+                self.df[col] = pd.to_numeric(s, downcast='integer')
+            elif pd.api.types.is_float_dtype(s.dtype):
+                values = s.to_numpy()
+                as_f32 = values.astype(np.float32)
+                if np.array_equal(as_f32.astype(values.dtype), values, equal_nan=True):
+                    self.df[col] = as_f32
+            elif (pd.api.types.is_object_dtype(s.dtype) or pd.api.types.is_string_dtype(s.dtype)) \
+                    and self._n_rows > 1000 and s.nunique() / self._n_rows < 0.5:
+                self.df[col] = s.astype('category')
+    
     # =========================================================================
     # MISSING VALUES ANALYSIS
     # =========================================================================
     
+    def _compute_null_mask(self) -> np.ndarray:
+        """Return the (rows x columns) null mask, computed once per load."""
+        if self._null_mask is None:
+            self._null_mask = self.df.isna().to_numpy()
+        return self._null_mask
+    
     def analyze_missing_values(self) -> dict:
         """Analyze missing values in the dataset."""
         print("=" * 60)
         print("MISSING VALUES ANALYSIS")
         print("=" * 60)
         
-        missing = self.df.isnull().sum()
-        missing_pct = (missing / len(self.df)) * 100
+        missing = pd.Series(self._compute_null_mask().sum(axis=0), index=self._columns)
+        missing_pct = (missing / self._n_rows) * 100
         
         missing_df = pd.DataFrame({
-            'Column': self.df.columns,
+            'Column': self._columns,
             'Missing Count': missing.values,
             'Missing %': missing_pct.values,
-            'Data Type': self.df.dtypes.values
+            'Data Type': self._dtypes.values
         }).sort_values('Missing %', ascending=False)
         
         # Classify missing pattern
         total_missing = missing.sum()
-        total_cells = self.df.shape[0] * self.df.shape[1]
+        total_cells = self._n_rows * len(self._columns)
         overall_missing_pct = (total_missing / total_cells) * 100
         
         # Columns with >50% missing (potentially useless)
@@ -98,7 +359,7 @@ class DataQualityReport:
         
         # Print summary
         print(f"\n📊 Overall: {total_missing:,} missing values ({overall_missing_pct:.2f}% of all data)")
-        print(f"   Columns with missing data: {len(cols_with_missing)} of {len(self.df.columns)}")
+        print(f"   Columns with missing data: {len(cols_with_missing)} of {len(self._columns)}")
         
         if len(high_missing_cols) > 0:
             print(f"\n⚠️  High-risk columns (>50% missing):")
@@ -109,26 +370,59 @@ class DataQualityReport:
         if len(cols_with_missing) > 0:
             print(f"\n📋 Missing Values by Column:")
             print("-" * 50)
-            for _, row in cols_with_missing.iterrows():
-                if row['Missing %'] > 0:
-                    bar = "█" * int(row['Missing %'] / 5) + "░" * (20 - int(row['Missing %'] / 5))
-                    print(f"   {row['Column'][:25]:<25} {bar} {row['Missing %']:>6.1f}%")
+            for col, pct in zip(cols_with_missing['Column'], cols_with_missing['Missing %']):
+                if pct > 0:
+                    bar = _BARS[min(20, int(pct / 5))]
+                    print(f"   {col[:25]:<25} {bar} {pct:>6.1f}%")
         else:
             print("\n✅ No missing values found!")
         
         return self.report_data['missing']
     
+    def _figure_html(self, fig, alt: str) -> str:
+        """
+        Render a figure for embedding in the HTML report and close it.
+
+        Inline SVG is usually smaller than a base64 PNG and stays sharp;
+        figures whose SVG outgrows _SVG_MAX_BYTES (e.g. many flier points)
+        are embedded as PNG instead.
+        """
+        buffer = BytesIO()
+        fig.savefig(buffer, format='svg')
+        svg = buffer.getvalue().decode('utf-8')
+        if len(svg) <= _SVG_MAX_BYTES:
+            html = svg[svg.index('<svg'):].rstrip().replace('<svg ', f'<svg role="img" aria-label="{alt}" ', 1)
+        else:
+            buffer = BytesIO()
+            fig.savefig(buffer, format='png', dpi=_PNG_DPI, pil_kwargs=_PNG_KWARGS)
+            img_str = base64.b64encode(buffer.getvalue()).decode()
+            html = f'<img src="data:image/png;base64,{img_str}" alt="{alt}">'
+        plt.close(fig)
+        return html
+    
     def create_missing_heatmap(self) -> str:
-        """Create a heatmap visualization of missing values."""
-        fig, axes = plt.subplots(1, 2, figsize=(14, max(6, len(self.df.columns) * 0.3)))
+        """Create a heatmap visualization of missing values (HTML snippet)."""
+        fig, axes = plt.subplots(1, 2, figsize=(14, max(6, len(self._columns) * 0.3)), layout='constrained')
+        
+        null_mask = self._compute_null_mask()
         
         # Heatmap of missing values (sample if too large)
-        sample_size = min(100, len(self.df))
-        sample_df = self.df.sample(n=sample_size, random_state=42) if len(self.df) > 100 else self.df
+        sample_size = min(100, self._n_rows)
+        if self._n_rows > 100:
+            sample_idx = np.random.default_rng(42).choice(self._n_rows, size=sample_size, replace=False)
+            null_sample = null_mask[sample_idx]
+        else:
+            null_sample = null_mask
         
+        # Single raster image instead of one patch per cell
         ax1 = axes[0]
-        sns.heatmap(sample_df.isnull(), cbar=True, yticklabels=False, 
-                    cmap='YlOrRd', ax=ax1)
+        im = ax1.imshow(null_sample.astype(np.uint8), aspect='auto', cmap='YlOrRd',
+                        interpolation='nearest', vmin=0, vmax=1)
+        fig.colorbar(im, ax=ax1)
+        ax1.set_xticks(np.arange(len(self._columns)))
+        ax1.set_xticklabels(self._columns)
+        ax1.set_yticks([])
+        ax1.grid(False)
         ax1.set_title(f'Missing Values Heatmap\n(Sample of {sample_size} rows)', fontsize=12, fontweight='bold')
         ax1.set_xlabel('Columns')
         ax1.set_ylabel('Rows')
@@ -136,7 +430,7 @@ class DataQualityReport:
         
         # Bar chart of missing percentages
         ax2 = axes[1]
-        missing_pct = (self.df.isnull().sum() / len(self.df)) * 100
+        missing_pct = pd.Series(null_mask.sum(axis=0), index=self._columns) / self._n_rows * 100
         colors = ['#e74c3c' if x > 50 else '#f39c12' if x > 20 else '#3498db' for x in missing_pct]
         
         bars = ax2.barh(range(len(missing_pct)), missing_pct.values, color=colors)
@@ -152,16 +446,7 @@ class DataQualityReport:
             if pct > 0:
                 ax2.text(pct + 1, i, f'{pct:.1f}%', va='center', fontsize=8)
         
-        plt.tight_layout()
-        
-        # Convert to base64 for HTML embedding
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-        buffer.seek(0)
-        img_str = base64.b64encode(buffer.read()).decode()
-        plt.close()
-        
-        return img_str
+        return self._figure_html(fig, 'Missing Values Heatmap')
     
     # =========================================================================
     # OUTLIER ANALYSIS
@@ -173,63 +458,101 @@ class DataQualityReport:
         print("OUTLIER ANALYSIS")
         print("=" * 60)
         
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_cols = self._numeric_cols
         
         if not numeric_cols:
             print("\n⚠️  No numeric columns found for outlier analysis.")
-            self.report_data['outliers'] = {'numeric_columns': 0, 'details': []}
+            self.report_data['outliers'] = {
+                'numeric_columns': 0, 'columns_with_outliers': 0,
+                'total_outliers': 0, 'details': [],
+                'impossible_cols': [], 'high_outlier_cols': []
+            }
             return self.report_data['outliers']
         
         outlier_details = []
+        # Columns the recommendations and quality score single out
+        impossible_cols = []
+        high_outlier_cols = []
         
         print(f"\n📊 Analyzing {len(numeric_cols)} numeric columns...")
         print("-" * 60)
         
-        for col in numeric_cols:
-            data = self.df[col].dropna()
-            
-            if len(data) == 0:
+        # One column-major float matrix: each statistic is a single NaN-aware
+        # reduction over all numeric columns instead of per-column dropna()
+        arr = np.asfortranarray(self.df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan))
+        counts = (~np.isnan(arr)).sum(axis=0)
+        
+        # Quartiles, fence counts and whisker ends (numba kernel when available)
+        Q1, medians, Q3, low_counts, high_counts, whislo, whishi = iqr_stats(arr)
+        IQR = Q3 - Q1
+        
+        lower_bounds = Q1 - 1.5 * IQR
+        upper_bounds = Q3 + 1.5 * IQR
+        
+        outlier_counts = low_counts + high_counts
+        means = np.nanmean(arr, axis=0)
+        stds = np.nanstd(arr, axis=0, ddof=1)
+        mins = np.nanmin(arr, axis=0)
+        maxs = np.nanmax(arr, axis=0)
+        
+        # Precomputed boxplot stats; fliers capped so the plot stays cheap to draw
+        rng = np.random.default_rng(42)
+        self._boxplot_stats = {}
+        
+        for i, col in enumerate(numeric_cols):
+            if counts[i] == 0:
                 continue
-                
-            Q1 = data.quantile(0.25)
-            Q3 = data.quantile(0.75)
-            IQR = Q3 - Q1
             
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
+            fliers = []
+            values = arr[:, i]
+            for side in (values[values < lower_bounds[i]], values[values > upper_bounds[i]]):
+                if len(side) > _MAX_FLIERS:
+                    # Keep the extremes so the axis range matches the full data
+                    side = np.concatenate([[side.min(), side.max()],
+                                           rng.choice(side, size=_MAX_FLIERS - 2, replace=False)])
+                fliers.append(side)
+            self._boxplot_stats[col] = {
+                'med': medians[i], 'q1': Q1[i], 'q3': Q3[i],
+                'whislo': whislo[i], 'whishi': whishi[i],
+                'fliers': np.concatenate(fliers)
+            }
             
-            outliers = data[(data < lower_bound) | (data > upper_bound)]
-            outlier_count = len(outliers)
-            outlier_pct = (outlier_count / len(data)) * 100
+            outlier_count = int(outlier_counts[i])
+            outlier_pct = (outlier_count / counts[i]) * 100
             
             # Check for "impossible" values
             impossible_values = []
-            if data.min() < 0 and col.lower() in ['age', 'price', 'quantity', 'count', 'amount']:
-                impossible_values.append(f"Negative values found (min: {data.min():.2f})")
-            if col.lower() == 'age' and data.max() > 120:
-                impossible_values.append(f"Age > 120 found (max: {data.max():.0f})")
+            col_lower = col.lower()
+            if mins[i] < 0 and col_lower in _NONNEG_COLS:
+                impossible_values.append(f"Negative values found (min: {mins[i]:.2f})")
+            if col_lower == 'age' and maxs[i] > 120:
+                impossible_values.append(f"Age > 120 found (max: {maxs[i]:.0f})")
             
             detail = {
                 'column': col,
-                'count': len(data),
-                'mean': round(data.mean(), 2),
-                'std': round(data.std(), 2),
-                'min': round(data.min(), 2),
-                'max': round(data.max(), 2),
-                'Q1': round(Q1, 2),
-                'Q3': round(Q3, 2),
-                'IQR': round(IQR, 2),
-                'lower_bound': round(lower_bound, 2),
-                'upper_bound': round(upper_bound, 2),
+                'count': int(counts[i]),
+                'mean': round(means[i], 2),
+                'std': round(stds[i], 2),
+                'min': round(mins[i], 2),
+                'max': round(maxs[i], 2),
+                'Q1': round(Q1[i], 2),
+                'Q3': round(Q3[i], 2),
+                'IQR': round(IQR[i], 2),
+                'lower_bound': round(lower_bounds[i], 2),
+                'upper_bound': round(upper_bounds[i], 2),
                 'outlier_count': outlier_count,
                 'outlier_pct': round(outlier_pct, 2),
                 'impossible_values': impossible_values
             }
             outlier_details.append(detail)
+            if impossible_values:
+                impossible_cols.append(col)
+            if detail['outlier_pct'] > 10:
+                high_outlier_cols.append(col)
             
             # Print summary
             status = "⚠️ " if outlier_pct > 5 or impossible_values else "  "
-            print(f"{status}{col[:30]:<30} | Outliers: {outlier_count:>6} ({outlier_pct:>5.1f}%) | Range: [{data.min():.2f}, {data.max():.2f}]")
+            print(f"{status}{col[:30]:<30} | Outliers: {outlier_count:>6} ({outlier_pct:>5.1f}%) | Range: [{mins[i]:.2f}, {maxs[i]:.2f}]")
             
             for warning in impossible_values:
                 print(f"      🚨 {warning}")
@@ -242,7 +565,9 @@ class DataQualityReport:
             'numeric_columns': len(numeric_cols),
             'columns_with_outliers': cols_with_outliers,
             'total_outliers': total_outliers,
-            'details': outlier_details
+            'details': outlier_details,
+            'impossible_cols': impossible_cols,
+            'high_outlier_cols': high_outlier_cols
         }
         
         print(f"\n📈 Summary: {total_outliers:,} total outliers across {cols_with_outliers} columns")
@@ -250,8 +575,8 @@ class DataQualityReport:
         return self.report_data['outliers']
     
     def create_outlier_boxplots(self) -> str:
-        """Create boxplots for numeric columns to visualize outliers."""
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        """Create boxplots for numeric columns to visualize outliers (HTML snippet)."""
+        numeric_cols = self._numeric_cols
 
         if not numeric_cols:
             return ""
@@ -263,15 +588,21 @@ class DataQualityReport:
         # Calculate grid dimensions (3 columns per row)
         n_rows = (n_cols + 2) // 3
 
-        fig, axes = plt.subplots(n_rows, 3, figsize=(14, 4 * n_rows))
-        axes = axes.flatten() if n_cols > 1 else [axes]
+        fig, axes = plt.subplots(n_rows, 3, figsize=(14, 4 * n_rows), layout='constrained')
+        axes = axes.flatten()
+
+        # Counts already computed by analyze_outliers (same IQR rule)
+        known = {d['column']: d for d in self.report_data.get('outliers', {}).get('details', [])}
 
         for idx, col in enumerate(plot_cols):
             ax = axes[idx]
-            data = self.df[col].dropna()
             
-            # Create boxplot
-            bp = ax.boxplot(data, patch_artist=True, vert=True)
+            # Create boxplot (from analyze_outliers' stats when available)
+            if col in self._boxplot_stats:
+                bp = ax.bxp([self._boxplot_stats[col]], patch_artist=True, vert=True)
+            else:
+                data = self.df[col].dropna()
+                bp = ax.boxplot(data, patch_artist=True, vert=True)
             bp['boxes'][0].set_facecolor('#3498db')
             bp['boxes'][0].set_alpha(0.7)
             
@@ -283,12 +614,18 @@ class DataQualityReport:
             ax.set_ylabel('Value')
             
             # Add stats annotation
-            Q1 = data.quantile(0.25)
-            Q3 = data.quantile(0.75)
-            IQR = Q3 - Q1
-            outlier_count = len(data[(data < Q1 - 1.5*IQR) | (data > Q3 + 1.5*IQR)])
+            if col in known:
+                n_values = known[col]['count']
+                outlier_count = known[col]['outlier_count']
+            else:
+                data = self.df[col].dropna()
+                n_values = len(data)
+                Q1 = data.quantile(0.25)
+                Q3 = data.quantile(0.75)
+                IQR = Q3 - Q1
+                outlier_count = len(data[(data < Q1 - 1.5*IQR) | (data > Q3 + 1.5*IQR)])
             
-            stats_text = f'n={len(data):,}\nOutliers: {outlier_count}'
+            stats_text = f'n={n_values:,}\nOutliers: {outlier_count}'
             ax.text(0.98, 0.98, stats_text, transform=ax.transAxes, 
                     fontsize=8, verticalalignment='top', horizontalalignment='right',
                     bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
@@ -298,17 +635,9 @@ class DataQualityReport:
             axes[idx].set_visible(False)
         
         plt.suptitle('Outlier Detection: Boxplots of Numeric Columns', 
-                     fontsize=14, fontweight='bold', y=1.02)
-        plt.tight_layout()
+                     fontsize=14, fontweight='bold')
         
-        # Convert to base64
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-        buffer.seek(0)
-        img_str = base64.b64encode(buffer.read()).decode()
-        plt.close()
-        
-        return img_str
+        return self._figure_html(fig, 'Outlier Boxplots')
     
     # =========================================================================
     # DUPLICATE ANALYSIS
@@ -320,35 +649,33 @@ class DataQualityReport:
         print("DUPLICATE ANALYSIS")
         print("=" * 60)
 
-        # Exact duplicates
-        exact_duplicates = self.df.duplicated().sum()
-        exact_dup_pct = (exact_duplicates / len(self.df)) * 100
+        # Exact duplicates: hash each row to 64 bits once and count distinct hashes
+        if self._row_hash is None:
+            self._row_hash = pd.util.hash_pandas_object(self.df, index=False).to_numpy()
+        exact_duplicates = self._n_rows - len(pd.unique(self._row_hash))
+        exact_dup_pct = (exact_duplicates / self._n_rows) * 100
 
         # Check for duplicates in identifier columns (ID, Name, Name+Location)
-        identifier_cols = []
-        for col in self.df.columns:
-            col_lower = col.lower()
-            if col_lower in ['id', 'name'] or col_lower.endswith('_id') or col_lower.endswith('_name'):
-                identifier_cols.append(col)
+        identifier_cols = [col for col in self._columns if _IDENT_RE.search(col)]
+
+        def _dup_stats(values: pd.Series) -> dict:
+            # One factorize pass gives both the unique count and the duplicates
+            codes, uniques = pd.factorize(values)
+            has_na = int((codes < 0).any())
+            return {
+                'duplicates': self._n_rows - len(uniques) - has_na,
+                'unique_count': len(uniques),
+                'total_count': self._n_rows
+            }
 
         identifier_duplicates = {}
         for col in identifier_cols:
-            dup_count = self.df[col].duplicated().sum()
-            identifier_duplicates[col] = {
-                'duplicates': dup_count,
-                'unique_count': self.df[col].nunique(),
-                'total_count': len(self.df)
-            }
+            identifier_duplicates[col] = _dup_stats(self.df[col])
 
         # Check Name + Location combination for better duplicate detection
-        if 'Name' in self.df.columns and 'Location' in self.df.columns:
+        if 'Name' in self._columns and 'Location' in self._columns:
             combined = self.df['Name'].astype(str) + ' | ' + self.df['Location'].astype(str)
-            dup_count = combined.duplicated().sum()
-            identifier_duplicates['Name + Location'] = {
-                'duplicates': dup_count,
-                'unique_count': combined.nunique(),
-                'total_count': len(self.df)
-            }
+            identifier_duplicates['Name + Location'] = _dup_stats(combined)
             identifier_cols.append('Name + Location')
 
         self.report_data['duplicates'] = {
@@ -389,16 +716,16 @@ class DataQualityReport:
         print("DATA TYPE ANALYSIS")
         print("=" * 60)
         
-        type_summary = self.df.dtypes.value_counts().to_dict()
+        type_summary = self._dtypes.value_counts().to_dict()
         type_summary = {str(k): v for k, v in type_summary.items()}
         
         column_types = []
         type_warnings = []
         
-        for col in self.df.columns:
-            dtype = str(self.df[col].dtype)
+        for col in self._columns:
+            dtype = str(self._dtypes[col])
             unique_count = self.df[col].nunique()
-            unique_pct = (unique_count / len(self.df)) * 100
+            unique_pct = (unique_count / self._n_rows) * 100
             
             col_info = {
                 'column': col,
@@ -410,19 +737,19 @@ class DataQualityReport:
             
             # Check for potential type issues
             if dtype == 'object':
+                sample = [str(v) for v in self.df[col].dropna().head(100).unique()]
+                
                 # Check if it could be numeric
-                try:
-                    pd.to_numeric(self.df[col].dropna().head(100), errors='raise')
+                if sample and all(_NUM_RE.match(v) for v in sample):
                     type_warnings.append(f"'{col}' is stored as text but appears numeric")
-                except:
-                    pass
                 
-                # Check if it could be datetime
-                try:
-                    pd.to_datetime(self.df[col].dropna().head(100), errors='raise')
-                    type_warnings.append(f"'{col}' is stored as text but appears to be datetime")
-                except:
-                    pass
+                # Check if it could be datetime (only date-shaped text reaches pandas)
+                if sample and all(_DATE_RE.match(v) for v in sample):
+                    try:
+                        pd.to_datetime(pd.Series(sample), errors='raise')
+                        type_warnings.append(f"'{col}' is stored as text but appears to be datetime")
+                    except (ValueError, TypeError, OverflowError):
+                        pass
         
         self.report_data['data_types'] = {
             'summary': type_summary,
@@ -453,7 +780,7 @@ class DataQualityReport:
         print("=" * 60)
 
         # Get categorical columns (object and category dtypes only)
-        categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns.tolist()
+        categorical_cols = self._categorical_cols
 
         if not categorical_cols:
             print("\n⚠️  No categorical columns found.")
@@ -466,23 +793,36 @@ class DataQualityReport:
         print("-" * 60)
 
         for col in categorical_cols:
-            unique_values = self.df[col].dropna().unique().tolist()
-            value_counts = self.df[col].value_counts(dropna=False).to_dict()
+            # One hash pass: codes in first-appearance order, nulls coded -1
+            codes, uniques = pd.factorize(self.df[col])
+            counts = np.bincount(codes + 1, minlength=len(uniques) + 1)
+            null_count = int(counts[0])
+            unique_values = uniques.tolist()
+
+            # Same ordering as value_counts(dropna=False): by count, ties by appearance
+            keys = unique_values + [np.nan] if null_count else unique_values
+            key_counts = counts[1:].tolist() + [null_count] if null_count else counts[1:].tolist()
+            order = np.argsort(-np.asarray(key_counts), kind='stable')
+            value_counts = {keys[i]: key_counts[i] for i in order}
+            # The report lists the first 20 values in appearance order with their counts
+            top_values = list(zip(unique_values[:20], key_counts[:20]))
 
             detail = {
                 'column': col,
-                'dtype': str(self.df[col].dtype),
+                'dtype': str(self._dtypes[col]),
                 'unique_count': len(unique_values),
                 'unique_values': unique_values,
                 'value_counts': value_counts,
-                'has_nulls': self.df[col].isnull().any()
+                'top_values': top_values,
+                'remaining_count': max(0, len(unique_values) - 20),
+                'has_nulls': null_count > 0,
+                'null_count': null_count
             }
             categorical_details.append(detail)
 
             # Print summary
             print(f"\n   {col} ({len(unique_values)} unique values):")
-            for val in unique_values[:10]:  # Show first 10 in console
-                count = value_counts.get(val, 0)
+            for val, count in top_values[:10]:  # Show first 10 in console
                 print(f"      - {val}: {count:,}")
             if len(unique_values) > 10:
                 print(f"      ... and {len(unique_values) - 10} more values")
@@ -500,179 +840,112 @@ class DataQualityReport:
     # HTML REPORT GENERATION
     # =========================================================================
     
+    def _render_figures(self):
+        """Render the report figures (already rendered when loaded from the cache)."""
+        if self._figures is None:
+            self._figures = {
+                'missing_heatmap': self.create_missing_heatmap(),
+                'outlier_boxplots': self.create_outlier_boxplots()
+            }
+    
+    def _release_data(self):
+        """Drop the DataFrame and its derived arrays once the figures exist."""
+        self.df = None
+        self._null_mask = None
+        self._row_hash = None
+        self._boxplot_stats = {}
+    
     def generate_html_report(self, output_path: str = None) -> str:
         """Generate a comprehensive HTML report with all visualizations."""
         
         if output_path is None:
             output_path = self.filepath.stem + "_quality_report.html"
         
-        # Generate visualizations
-        missing_heatmap = self.create_missing_heatmap()
-        outlier_boxplots = self.create_outlier_boxplots()
+        self._render_figures()
+        missing_heatmap = self._figures['missing_heatmap']
+        outlier_boxplots = self._figures['outlier_boxplots']
+        
+        # Write the page section by section instead of building it as one string
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(self._iter_html_sections(missing_heatmap, outlier_boxplots))
+        
+        print(f"\n✅ HTML report saved to: {output_path}")
+        return output_path
+    
+    def _iter_html_sections(self, missing_heatmap: str, outlier_boxplots: str):
+        """Yield the HTML report in document order, one section at a time."""
+        # Row fragments are built up front so the section markup has no nested loops
+        missing_rows = self._generate_missing_rows_html()
+        rd = self.report_data
+        miss = rd['missing']
+        out = rd['outliers']
+        dup = rd['duplicates']
+        # One timestamp for the header and the footer
+        now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        # Build HTML
-        html = f"""
-<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Data Quality Report - {self.report_data['filename']}</title>
-    <style>
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{ 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            line-height: 1.6; 
-            color: #333;
-            background: #f5f7fa;
-            padding: 20px;
-        }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .header h1 {{ font-size: 2em; margin-bottom: 10px; }}
-        .header .meta {{ opacity: 0.9; font-size: 0.95em; }}
-        .card {{
-            background: white;
-            border-radius: 10px;
-            padding: 25px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.08);
-        }}
-        .card h2 {{
-            color: #667eea;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-        }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-bottom: 20px;
-        }}
-        .stat-box {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            border-left: 4px solid #667eea;
-        }}
-        .stat-box .number {{ font-size: 2em; font-weight: bold; color: #667eea; }}
-        .stat-box .label {{ color: #666; font-size: 0.9em; }}
-        .warning {{ color: #e74c3c; }}
-        .success {{ color: #27ae60; }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 15px 0;
-            font-size: 0.9em;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{ background: #f8f9fa; font-weight: 600; }}
-        tr:hover {{ background: #f8f9fa; }}
-        .visualization {{ text-align: center; margin: 20px 0; }}
-        .visualization img {{ max-width: 100%; border-radius: 8px; }}
-        .progress-bar {{
-            background: #e9ecef;
-            border-radius: 10px;
-            height: 20px;
-            overflow: hidden;
-        }}
-        .progress-fill {{
-            height: 100%;
-            background: linear-gradient(90deg, #667eea, #764ba2);
-            transition: width 0.3s;
-        }}
-        .badge {{
-            display: inline-block;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 0.8em;
-            font-weight: 600;
-        }}
-        .badge-danger {{ background: #ffebee; color: #c62828; }}
-        .badge-warning {{ background: #fff3e0; color: #ef6c00; }}
-        .badge-success {{ background: #e8f5e9; color: #2e7d32; }}
-        .summary-section {{
-            background: linear-gradient(135deg, #f5f7fa 0%, #e4e8ec 100%);
-            padding: 20px;
-            border-radius: 8px;
-            margin-top: 20px;
-        }}
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            color: #666;
-            font-size: 0.9em;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
+    <title>Data Quality Report - {rd['filename']}</title>
+"""
+        yield _REPORT_HEAD
+        yield f"""        <div class="header">
             <h1>📊 Data Quality Report</h1>
             <div class="meta">
-                <strong>Dataset:</strong> {self.report_data['filename']} | 
-                <strong>Rows:</strong> {self.report_data['rows']:,} | 
-                <strong>Columns:</strong> {self.report_data['columns']} |
-                <strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                <strong>Dataset:</strong> {rd['filename']} | 
+                <strong>Rows:</strong> {rd['rows']:,} | 
+                <strong>Columns:</strong> {rd['columns']} |
+                <strong>Generated:</strong> {now_str}
             </div>
         </div>
 
-        <!-- Executive Summary -->
+"""
+        yield f"""        <!-- Executive Summary -->
         <div class="card">
             <h2>📋 Executive Summary</h2>
             <div class="stats-grid">
                 <div class="stat-box">
-                    <div class="number">{self.report_data['rows']:,}</div>
+                    <div class="number">{rd['rows']:,}</div>
                     <div class="label">Total Rows</div>
                 </div>
                 <div class="stat-box">
-                    <div class="number">{self.report_data['columns']}</div>
+                    <div class="number">{rd['columns']}</div>
                     <div class="label">Total Columns</div>
                 </div>
                 <div class="stat-box">
-                    <div class="number">{self.report_data['missing']['overall_missing_pct']:.1f}%</div>
+                    <div class="number">{miss['overall_missing_pct']:.1f}%</div>
                     <div class="label">Missing Data</div>
                 </div>
                 <div class="stat-box">
-                    <div class="number">{self.report_data['duplicates']['exact_duplicates']:,}</div>
+                    <div class="number">{dup['exact_duplicates']:,}</div>
                     <div class="label">Duplicate Rows</div>
                 </div>
             </div>
         </div>
 
-        <!-- Missing Values -->
+"""
+        yield f"""        <!-- Missing Values -->
         <div class="card">
             <h2>🔍 Missing Values Analysis</h2>
             <div class="stats-grid">
                 <div class="stat-box">
-                    <div class="number">{self.report_data['missing']['total_missing_cells']:,}</div>
+                    <div class="number">{miss['total_missing_cells']:,}</div>
                     <div class="label">Missing Cells</div>
                 </div>
                 <div class="stat-box">
-                    <div class="number">{self.report_data['missing']['columns_with_missing']}</div>
+                    <div class="number">{miss['columns_with_missing']}</div>
                     <div class="label">Affected Columns</div>
                 </div>
                 <div class="stat-box">
-                    <div class="number">{len(self.report_data['missing']['high_missing_columns'])}</div>
+                    <div class="number">{len(miss['high_missing_columns'])}</div>
                     <div class="label">High-Risk Columns (&gt;50%)</div>
                 </div>
             </div>
             
             <div class="visualization">
-                <img src="data:image/png;base64,{missing_heatmap}" alt="Missing Values Heatmap">
+                {missing_heatmap}
             </div>
             
             <h3>Missing Values by Column</h3>
@@ -686,49 +959,42 @@ class DataQualityReport:
                     </tr>
                 </thead>
                 <tbody>
-                    {''.join(f"""
-                    <tr>
-                        <td>{row['Column']}</td>
-                        <td>{row['Missing Count']:,}</td>
-                        <td>
-                            <div class="progress-bar">
-                                <div class="progress-fill" style="width: {min(row['Missing %'], 100)}%"></div>
-                            </div>
-                            {row['Missing %']:.1f}%
-                        </td>
-                        <td>
-                            {'<span class="badge badge-danger">Critical</span>' if row['Missing %'] > 50 
-                             else '<span class="badge badge-warning">Warning</span>' if row['Missing %'] > 20 
-                             else '<span class="badge badge-success">OK</span>' if row['Missing %'] == 0 
-                             else '<span class="badge badge-warning">Minor</span>'}
-                        </td>
-                    </tr>
-                    """ for row in self.report_data['missing']['details'][:20])}
+                    {missing_rows}
                 </tbody>
             </table>
         </div>
 
-        <!-- Outliers -->
+"""
+        yield f"""        <!-- Outliers -->
         <div class="card">
             <h2>📈 Outlier Analysis</h2>
             <p>Using the IQR (Interquartile Range) method to detect statistical outliers in numeric columns.</p>
             
             <div class="stats-grid">
                 <div class="stat-box">
-                    <div class="number">{self.report_data['outliers']['numeric_columns']}</div>
+                    <div class="number">{out['numeric_columns']}</div>
                     <div class="label">Numeric Columns</div>
                 </div>
                 <div class="stat-box">
-                    <div class="number">{self.report_data['outliers']['columns_with_outliers']}</div>
+                    <div class="number">{out['columns_with_outliers']}</div>
                     <div class="label">Columns with Outliers</div>
                 </div>
                 <div class="stat-box">
-                    <div class="number">{self.report_data['outliers']['total_outliers']:,}</div>
+                    <div class="number">{out['total_outliers']:,}</div>
                     <div class="label">Total Outliers</div>
                 </div>
             </div>
             
-            {'<div class="visualization"><img src="data:image/png;base64,' + outlier_boxplots + '" alt="Outlier Boxplots"></div>' if outlier_boxplots else '<p>No numeric columns to analyze.</p>'}
+"""
+        # Without numeric columns there is neither a figure nor a details table
+        if not outlier_boxplots:
+            yield """            <p>No numeric columns to analyze.</p>
+        </div>
+
+"""
+        else:
+            outlier_rows = self._generate_outlier_rows_html()
+            yield f"""            <div class="visualization">{outlier_boxplots}</div>
             
             <h3>Outlier Details by Column</h3>
             <table>
@@ -744,67 +1010,65 @@ class DataQualityReport:
                     </tr>
                 </thead>
                 <tbody>
-                    {''.join(f"""
-                    <tr>
-                        <td>{row['column']}</td>
-                        <td>{row['min']:,.2f}</td>
-                        <td>{row['max']:,.2f}</td>
-                        <td>{row['mean']:,.2f}</td>
-                        <td>{row['outlier_count']:,}</td>
-                        <td>{row['outlier_pct']:.1f}%</td>
-                        <td>{'<br>'.join(f'🚨 {w}' for w in row['impossible_values']) if row['impossible_values'] else '✓'}</td>
-                    </tr>
-                    """ for row in self.report_data['outliers']['details'])}
+                    {outlier_rows}
                 </tbody>
             </table>
         </div>
 
-        <!-- Duplicates -->
+"""
+        identifier_html = self._generate_identifier_duplicates_html()
+        if dup['exact_duplicates'] > 0:
+            dup_action_html = f"""
+            <div class="summary-section" style="background: #ffebee;">
+                <h4>🚨 Action Required</h4>
+                <p>Found <strong>{dup['exact_duplicates']:,}</strong> duplicate rows. 
+                These should be investigated and likely removed before model training to prevent bias.</p>
+            </div>
+            """
+        else:
+            dup_action_html = _NO_DUPLICATES_HTML
+        yield f"""        <!-- Duplicates -->
         <div class="card">
             <h2>🔄 Duplicate Analysis</h2>
             <div class="stats-grid">
                 <div class="stat-box">
-                    <div class="number {'warning' if self.report_data['duplicates']['exact_duplicates'] > 0 else 'success'}">
-                        {self.report_data['duplicates']['exact_duplicates']:,}
+                    <div class="number {'warning' if dup['exact_duplicates'] > 0 else 'success'}">
+                        {dup['exact_duplicates']:,}
                     </div>
                     <div class="label">Exact Duplicate Rows</div>
                 </div>
                 <div class="stat-box">
-                    <div class="number">{self.report_data['duplicates']['exact_duplicate_pct']:.2f}%</div>
+                    <div class="number">{dup['exact_duplicate_pct']:.2f}%</div>
                     <div class="label">Percentage of Data</div>
                 </div>
             </div>
             
-            {self._generate_identifier_duplicates_html()}
+            {identifier_html}
             
-            {f'''
-            <div class="summary-section" style="background: #ffebee;">
-                <h4>🚨 Action Required</h4>
-                <p>Found <strong>{self.report_data['duplicates']['exact_duplicates']:,}</strong> duplicate rows. 
-                These should be investigated and likely removed before model training to prevent bias.</p>
-            </div>
-            ''' if self.report_data['duplicates']['exact_duplicates'] > 0 else '''
-            <div class="summary-section" style="background: #e8f5e9;">
-                <h4>✅ No Exact Duplicates</h4>
-                <p>Great! No exact duplicate rows were found in the dataset.</p>
-            </div>
-            '''}
+            {dup_action_html}
         </div>
 
-        <!-- Categorical Values -->
+"""
+        yield f"""        <!-- Categorical Values -->
         <div class="card">
             <h2>📝 Categorical Values Analysis</h2>
             <div class="stats-grid">
                 <div class="stat-box">
-                    <div class="number">{self.report_data.get('categorical', {}).get('columns', 0)}</div>
+                    <div class="number">{rd.get('categorical', {}).get('columns', 0)}</div>
                     <div class="label">Categorical Columns</div>
                 </div>
             </div>
 
-            {self._generate_categorical_html()}
+            """
+        if rd.get('categorical', {}).get('details'):
+            yield from self._iter_categorical_html()
+        else:
+            yield _NO_CATEGORICAL_HTML
+        yield """
         </div>
 
-        <!-- Recommendations -->
+"""
+        yield f"""        <!-- Recommendations -->
         <div class="card">
             <h2>💡 Recommendations</h2>
             <div class="summary-section">
@@ -819,41 +1083,59 @@ class DataQualityReport:
         </div>
 
         <div class="footer">
-            <p>Generated by Data Quality Report Tool | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>Generated by Data Quality Report Tool | {now_str}</p>
         </div>
-    </div>
-</body>
-</html>
-        """
-        
-        # Save HTML file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
-        
-        print(f"\n✅ HTML report saved to: {output_path}")
-        return output_path
+"""
+        yield _REPORT_END
+    
+    def _generate_missing_rows_html(self) -> str:
+        """Generate the table rows for the missing values section."""
+        rows = []
+        for row in self.report_data['missing']['details'][:20]:
+            rows.append(f"""
+                    <tr>
+                        <td>{row['Column']}</td>
+                        <td>{row['Missing Count']:,}</td>
+                        <td>
+                            <div class="progress-bar">
+                                <div class="progress-fill" style="width: {min(row['Missing %'], 100)}%"></div>
+                            </div>
+                            {row['Missing %']:.1f}%
+                        </td>
+                        <td>
+                            {'<span class="badge badge-danger">Critical</span>' if row['Missing %'] > 50 
+                             else '<span class="badge badge-warning">Warning</span>' if row['Missing %'] > 20 
+                             else '<span class="badge badge-success">OK</span>' if row['Missing %'] == 0 
+                             else '<span class="badge badge-warning">Minor</span>'}
+                        </td>
+                    </tr>
+                    """)
+        return ''.join(rows)
+    
+    def _generate_outlier_rows_html(self) -> str:
+        """Generate the table rows for the outlier details section."""
+        rows = []
+        for row in self.report_data['outliers']['details']:
+            rows.append(f"""
+                    <tr>
+                        <td>{row['column']}</td>
+                        <td>{row['min']:,.2f}</td>
+                        <td>{row['max']:,.2f}</td>
+                        <td>{row['mean']:,.2f}</td>
+                        <td>{row['outlier_count']:,}</td>
+                        <td>{row['outlier_pct']:.1f}%</td>
+                        <td>{'<br>'.join([f'🚨 {w}' for w in row['impossible_values']]) if row['impossible_values'] else '✓'}</td>
+                    </tr>
+                    """)
+        return ''.join(rows)
     
     def _generate_quality_score_html(self) -> str:
         """Generate a data quality score based on the analysis."""
-        # Calculate score (0-100)
-        score = 100
-        
-        # Deduct for missing values
-        missing_pct = self.report_data['missing']['overall_missing_pct']
-        score -= min(30, missing_pct * 0.5)
-        
-        # Deduct for duplicates
-        dup_pct = self.report_data['duplicates']['exact_duplicate_pct']
-        score -= min(20, dup_pct * 2)
-        
-        # Deduct for high outlier columns
-        if self.report_data['outliers']['details']:
-            high_outlier_cols = sum(1 for d in self.report_data['outliers']['details'] if d['outlier_pct'] > 10)
-            score -= min(20, high_outlier_cols * 5)
-        
-        score = max(0, round(score))
-        
-        color = '#27ae60' if score >= 80 else '#f39c12' if score >= 60 else '#e74c3c'
+        rd = self.report_data
+        score = _quality_score(rd['missing']['overall_missing_pct'],
+                               rd['duplicates']['exact_duplicate_pct'],
+                               len(rd['outliers']['high_outlier_cols']))
+        color, verdict = next((c, t) for thr, c, t in _SCORE_BANDS if score >= thr)
         
         return f"""
         <div style="text-align: center; padding: 20px;">
@@ -863,9 +1145,7 @@ class DataQualityReport:
                 <div class="progress-fill" style="width: {score}%; background: {color};"></div>
             </div>
             <div style="margin-top: 10px; color: #666;">
-                {'Excellent data quality!' if score >= 80 
-                 else 'Good quality with some issues to address' if score >= 60 
-                 else 'Significant data quality issues detected'}
+                {verdict}
             </div>
         </div>
         """
@@ -873,41 +1153,42 @@ class DataQualityReport:
     def _generate_recommendations_html(self) -> str:
         """Generate recommendations based on the analysis."""
         recommendations = []
+        rd = self.report_data
+        miss = rd['missing']
+        out = rd['outliers']
+        dup = rd['duplicates']
         
         # Missing value recommendations
-        if self.report_data['missing']['high_missing_columns']:
-            cols = ', '.join(self.report_data['missing']['high_missing_columns'][:3])
+        if miss['high_missing_columns']:
+            cols = ', '.join(miss['high_missing_columns'][:3])
             recommendations.append(
                 f"<li><strong>High Missing Values:</strong> Consider dropping columns with >50% missing data ({cols}...) or investigate why data is missing.</li>"
             )
         
-        if self.report_data['missing']['overall_missing_pct'] > 5:
+        if miss['overall_missing_pct'] > 5:
             recommendations.append(
                 "<li><strong>Missing Data Strategy:</strong> Implement appropriate imputation (mean/median for numeric, mode for categorical) or use algorithms that handle missing values.</li>"
             )
         
         # Duplicate recommendations
-        if self.report_data['duplicates']['exact_duplicates'] > 0:
+        if dup['exact_duplicates'] > 0:
             recommendations.append(
-                f"<li><strong>Remove Duplicates:</strong> Found {self.report_data['duplicates']['exact_duplicates']:,} exact duplicates. Use <code>df.drop_duplicates()</code> to remove them.</li>"
+                f"<li><strong>Remove Duplicates:</strong> Found {dup['exact_duplicates']:,} exact duplicates. Use <code>df.drop_duplicates()</code> to remove them.</li>"
             )
         
         # Outlier recommendations
-        if self.report_data['outliers']['details']:
-            impossible_cols = [d['column'] for d in self.report_data['outliers']['details'] if d['impossible_values']]
-            if impossible_cols:
-                recommendations.append(
-                    f"<li><strong>Investigate Impossible Values:</strong> Columns {', '.join(impossible_cols[:3])} contain suspicious values that may be data entry errors.</li>"
-                )
-            
-            high_outlier = [d for d in self.report_data['outliers']['details'] if d['outlier_pct'] > 10]
-            if high_outlier:
-                recommendations.append(
-                    "<li><strong>Outlier Treatment:</strong> Consider capping, transforming (log), or removing outliers in high-impact columns.</li>"
-                )
+        if out['impossible_cols']:
+            recommendations.append(
+                f"<li><strong>Investigate Impossible Values:</strong> Columns {', '.join(out['impossible_cols'][:3])} contain suspicious values that may be data entry errors.</li>"
+            )
+        
+        if out['high_outlier_cols']:
+            recommendations.append(
+                "<li><strong>Outlier Treatment:</strong> Consider capping, transforming (log), or removing outliers in high-impact columns.</li>"
+            )
         
         # Type recommendations
-        if self.report_data.get('data_types', {}).get('warnings'):
+        if rd.get('data_types', {}).get('warnings'):
             recommendations.append(
                 "<li><strong>Fix Data Types:</strong> Some columns may have incorrect types. Review and convert to appropriate types for better analysis.</li>"
             )
@@ -924,7 +1205,7 @@ class DataQualityReport:
         if not identifier_duplicates:
             return ""
 
-        rows_html = ""
+        rows = []
         has_duplicates = False
 
         for col, info in identifier_duplicates.items():
@@ -938,7 +1219,7 @@ class DataQualityReport:
             else:
                 status = '<span class="badge badge-success">Unique</span>'
 
-            rows_html += f"""
+            rows.append(f"""
             <tr>
                 <td>{col}</td>
                 <td>{unique:,}</td>
@@ -946,8 +1227,9 @@ class DataQualityReport:
                 <td>{dups:,}</td>
                 <td>{status}</td>
             </tr>
-            """
+            """)
 
+        rows_html = ''.join(rows)
         warning_style = "background: #fff3e0;" if has_duplicates else ""
 
         return f"""
@@ -971,61 +1253,54 @@ class DataQualityReport:
         </div>
         """
 
-    def _generate_categorical_html(self) -> str:
-        """Generate HTML for categorical values analysis."""
-        categorical_data = self.report_data.get('categorical', {})
-        details = categorical_data.get('details', [])
-
-        if not details:
-            return "<p>No categorical columns found in the dataset.</p>"
-
-        html_parts = []
+    def _iter_categorical_html(self):
+        """Yield the HTML for categorical values analysis, one column at a time."""
+        details = self.report_data['categorical']['details']
+        n_rows = self._n_rows
 
-        for col_info in details:
+        for i, col_info in enumerate(details):
             col_name = col_info['column']
-            unique_values = col_info['unique_values']
-            value_counts = col_info['value_counts']
             unique_count = col_info['unique_count']
+            remaining_count = col_info['remaining_count']
 
             # Create a collapsible section for each column (limit to 20 values)
-            values_html = ""
-            display_values = unique_values[:20]
-            remaining_count = len(unique_values) - 20 if len(unique_values) > 20 else 0
-
-            for val in display_values:
-                count = value_counts.get(val, 0)
-                pct = (count / len(self.df)) * 100
+            rows = []
+            for val, count in col_info['top_values']:
+                pct = (count / n_rows) * 100
                 # Handle NaN display
                 display_val = str(val) if val is not None else "(null)"
-                values_html += f"""
+                rows.append(f"""
                 <tr>
                     <td>{display_val}</td>
                     <td>{count:,}</td>
                     <td>{pct:.1f}%</td>
                 </tr>
-                """
+                """)
 
             # Add row showing remaining values if truncated
             if remaining_count > 0:
-                values_html += f"""
+                rows.append(f"""
                 <tr style="background: #f0f0f0; font-style: italic;">
                     <td colspan="3">... and {remaining_count:,} more values</td>
                 </tr>
-                """
+                """)
 
             # Add null count if present
-            null_count = self.df[col_name].isnull().sum()
+            null_count = col_info['null_count']
             if null_count > 0:
-                null_pct = (null_count / len(self.df)) * 100
-                values_html += f"""
+                null_pct = (null_count / n_rows) * 100
+                rows.append(f"""
                 <tr style="background: #fff3e0;">
                     <td><em>(missing/null)</em></td>
                     <td>{null_count:,}</td>
                     <td>{null_pct:.1f}%</td>
                 </tr>
-                """
+                """)
 
-            html_parts.append(f"""
+            values_html = "".join(rows)
+            if i:
+                yield '\n'
+            yield f"""
             <div class="summary-section" style="margin-bottom: 15px;">
                 <h4>{col_name} <span class="badge badge-success">{unique_count} unique values</span></h4>
                 <table>
@@ -1041,9 +1316,54 @@ class DataQualityReport:
                     </tbody>
                 </table>
             </div>
-            """)
+            """
+
+    def _cache_key(self):
+        """Key the cache on the file's identity and contents stamp, or None if unreadable."""
+        try:
+            stat = self.filepath.stat()
+        except OSError:
+            return None
+        return hashlib.sha256(repr((
+            REPORT_CACHE_VERSION, str(self.filepath.resolve()), stat.st_size,
+            stat.st_mtime_ns, self.engine,
+            # Entries hold pickled pandas/NumPy objects and rendered figures
+            pd.__version__, np.__version__, matplotlib.__version__, sns.__version__
+        )).encode()).hexdigest()
+
+    def _cache_file(self) -> Path:
+        # One file per input path; a changed file simply overwrites its entry
+        name = hashlib.sha256(str(self.filepath.resolve()).encode()).hexdigest()[:16]
+        return REPORT_CACHE_DIR / f"{name}.pkl"
+
+    def _load_cache(self, cache_key: str) -> bool:
+        """Restore report data and rendered figures from the cache if it matches."""
+        # An unreadable, stale or malformed entry is just a cache miss
+        try:
+            with open(self._cache_file(), 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('key') != cache_key:
+                return False
+            report_data = cached['report_data']
+            figures = cached['figures']
+            console = cached['console']
+            n_rows = report_data['rows']
+        except Exception:
+            return False
+        self.report_data = report_data
+        self._figures = figures
+        self._console = console
+        self._n_rows = n_rows
+        return True
 
-        return '\n'.join(html_parts)
+    def _save_cache(self, cache_key: str):
+        try:
+            REPORT_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(self._cache_file(), 'wb') as f:
+                pickle.dump({'key': cache_key, 'report_data': self.report_data,
+                             'figures': self._figures, 'console': self._console}, f)
+        except OSError:
+            pass
 
     def run_full_analysis(self, output_path: str = None) -> dict:
         """Run the complete data quality analysis pipeline."""
@@ -1054,17 +1374,37 @@ class DataQualityReport:
         print(f"   Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
         
-        if not self.load_data():
-            return None
-        
-        self.analyze_missing_values()
-        self.analyze_outliers()
-        self.analyze_duplicates()
-        self.analyze_data_types()
-        self.analyze_categorical_values()
-
-        # Generate HTML report
-        report_path = self.generate_html_report(output_path)
+        # Disk Cache: an unchanged file only needs its HTML re-rendered
+        cache_key = self._cache_key() if self.use_cache else None
+        if cache_key is not None and self._load_cache(cache_key):
+            # Replay the console summary recorded when the analysis ran
+            print(self._console, end="")
+            print("  (analysis loaded from cache)")
+            report_path = self.generate_html_report(output_path)
+        else:
+            # Echo analysis output as usual while recording it for the cache
+            console = _Tee(sys.stdout)
+            with contextlib.redirect_stdout(console):
+                loaded = self.load_data()
+                if loaded:
+                    self.analyze_missing_values()
+                    self.analyze_outliers()
+                    self.analyze_duplicates()
+                    self.analyze_data_types()
+                    self.analyze_categorical_values()
+            if not loaded:
+                return None
+            self._console = console.getvalue()
+
+            # Everything the HTML needs is in report_data and the figures now,
+            # so the frame is freed before the report is written
+            self._render_figures()
+            self._release_data()
+
+            # Generate HTML report
+            report_path = self.generate_html_report(output_path)
+            if cache_key is not None:
+                self._save_cache(cache_key)
         
         print("\n" + "=" * 60)
         print("   ANALYSIS COMPLETE")
@@ -1075,18 +1415,19 @@ class DataQualityReport:
 
 def main():
     """Main entry point for command-line usage."""
-    if len(sys.argv) < 2:
-        print("Usage: python data_quality_report.py <path_to_csv>")
+    args = [a for a in sys.argv[1:] if a != '--no-cache']
+    if len(args) < 1:
+        print("Usage: python data_quality_report.py <path_to_csv> [output.html] [--no-cache]")
         print("\nExample: python data_quality_report.py data.csv")
         sys.exit(1)
     
-    filepath = sys.argv[1]
+    filepath = args[0]
     
     # Optional output path
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    output_path = args[1] if len(args) > 1 else None
     
     # Run analysis
-    report = DataQualityReport(filepath)
+    report = DataQualityReport(filepath, use_cache='--no-cache' not in sys.argv)
     report.run_full_analysis(output_path)
 
 